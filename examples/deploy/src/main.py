@@ -3,9 +3,22 @@
 from pathlib import Path
 from typing import Any
 
+import structlog
 from pydantic import BaseModel, Field
 
-from thalamus_serve import HFWeight, Thalamus
+from thalamus_serve import HFWeight, Thalamus, get_cache
+
+try:
+    import transformers
+except ImportError:
+    transformers = None
+
+log = structlog.get_logger()
+
+MAX_BATCH_SIZE = 32
+MAX_SEQUENCE_LENGTH = 512
+# File name ORTQuantizer gives the quantized export
+QUANTIZED_FILE = "model_quantized.onnx"
 
 
 class TextInput(BaseModel):
@@ -21,6 +34,15 @@ class SentimentOutput(BaseModel):
     score: float = Field(..., description="Confidence score")
 
 
+def _has_avx512_vnni() -> bool:
+    """True if the CPU advertises AVX512-VNNI (Linux only; False elsewhere)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            return "avx512_vnni" in f.read()
+    except OSError:
+        return False
+
+
 app = Thalamus(name="sentiment-service")
 
 
@@ -29,6 +51,7 @@ app = Thalamus(name="sentiment-service")
     version="1.0.0",
     description="DistilBERT sentiment analysis model",
     default=True,
+    max_batch_size=MAX_BATCH_SIZE,
     input_type=TextInput,
     output_type=SentimentOutput,
     weights={
@@ -43,17 +66,162 @@ class SentimentAnalyzer:
 
     def load(self, weights: dict[str, Path], device: str) -> None:
         """Load the sentiment analysis pipeline from downloaded weights."""
-        from transformers import pipeline
+        if transformers is None:
+            raise RuntimeError("SentimentAnalyzer requires transformers and torch")
 
         model_path = str(weights["model"])
-        self.pipeline = pipeline(
-            "sentiment-analysis",
-            model=model_path,
-            device=device if device != "cpu" else -1,
+        if device == "cpu":
+            self.pipeline = self._load_quantized(model_path)
+        elif device.startswith("cuda"):
+            self.pipeline = self._load_tensorrt(model_path, device)
+        if self.pipeline is None:
+            # SDPA dispatches to the fused flash / memory-efficient kernels
+            self.pipeline = transformers.pipeline(
+                "sentiment-analysis",
+                model=model_path,
+                device=device if device != "cpu" else -1,
+                use_fast=True,
+                model_kwargs={"attn_implementation": "sdpa"},
+            )
+            if device.startswith("cuda"):
+                import torch
+
+                # dynamic=True so new sequence lengths reuse the compiled graph
+                self.pipeline.model = torch.compile(self.pipeline.model, dynamic=True)
+
+        self._warm_up()
+
+    def _warm_up(self) -> None:
+        """Run throwaway batches so the first real request skips one-time setup.
+
+        Covers tokenizer initialization, kernel selection, and, when compiled,
+        graph capture for both a short and a long sequence length. Failures
+        are logged rather than raised; the model still serves without warm-up.
+        """
+        short, long = ["warm up"] * 4, ["warm up " * 64] * 4
+        try:
+            for texts in (short, long, short, long):
+                self.pipeline(texts, batch_size=len(texts), truncation=True)
+        except Exception as e:
+            log.warning("warmup_failed", model="sentiment", error=str(e))
+
+    def _load_tensorrt(self, model_path: str, device: str) -> Any:
+        """Serve through an FP16 TensorRT engine via ONNX Runtime, or None.
+
+        The engine is built into the weight cache, so only the first start on
+        a host pays the build, and the engine counts toward the cache budget
+        and is evicted and cleared like the weights. Returns None, falling back
+        to the transformers pipeline, when optimum, onnxruntime-gpu or TensorRT
+        is missing or the build fails.
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+        except ImportError:
+            return None
+
+        def shapes(batch: int, seq: int) -> str:
+            return f"input_ids:{batch}x{seq},attention_mask:{batch}x{seq}"
+
+        def session(engine_dir: Path) -> Any:
+            ort_model = ORTModelForSequenceClassification.from_pretrained(
+                model_path,
+                export=True,
+                provider="TensorrtExecutionProvider",
+                provider_options={
+                    "device_id": int(device.partition(":")[2] or 0),
+                    "trt_fp16_enable": True,
+                    "trt_engine_cache_enable": True,
+                    "trt_engine_cache_path": str(engine_dir),
+                    # One optimization profile spanning every batch and length
+                    # the service accepts, so new shapes never trigger a rebuild
+                    "trt_profile_min_shapes": shapes(1, 1),
+                    "trt_profile_opt_shapes": shapes(8, 128),
+                    "trt_profile_max_shapes": shapes(
+                        MAX_BATCH_SIZE, MAX_SEQUENCE_LENGTH
+                    ),
+                },
+            )
+            tokenizer = transformers.AutoTokenizer.from_pretrained(
+                model_path, use_fast=True
+            )
+            pipe = transformers.pipeline(
+                "sentiment-analysis", model=ort_model, tokenizer=tokenizer
+            )
+            # ONNX Runtime builds the engine lazily; surface build errors here
+            pipe(["warm up"], truncation=True)
+            return pipe
+
+        # On a miss put_dir runs the build, which serializes the engine into
+        # the new cache entry; on a hit the session loads the cached engine
+        built: list[Any] = []
+        key = f"sentiment-tensorrt/{Path(model_path).name}"
+        try:
+            engine_dir = get_cache().put_dir(
+                "artifacts", key, lambda dest: built.append(session(dest))
+            )
+            pipe = built[0] if built else session(engine_dir)
+        except Exception as e:
+            log.warning("tensorrt_unavailable", model="sentiment", error=str(e))
+            return None
+        return pipe
+
+    def _load_quantized(self, model_path: str) -> Any:
+        """Serve an INT8 ONNX export of the model, or None.
+
+        Dynamic INT8 quantization targets VNNI when the CPU has it and falls back
+        to the AVX2 kernels otherwise. The quantized model is built once per
+        model revision and instruction set into the weight cache, so it counts
+        toward the cache budget and is evicted and cleared like the weights.
+        Returns None, falling back to the transformers pipeline, when optimum
+        is missing or the export fails.
+        """
+        try:
+            from optimum.onnxruntime import (
+                ORTModelForSequenceClassification,
+                ORTQuantizer,
+            )
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        except ImportError:
+            return None
+
+        vnni = _has_avx512_vnni()
+
+        def quantize(dest: Path) -> None:
+            onnx_model = ORTModelForSequenceClassification.from_pretrained(
+                model_path, export=True
+            )
+            if vnni:
+                qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False)
+            else:
+                qconfig = AutoQuantizationConfig.avx2(is_static=False)
+            ORTQuantizer.from_pretrained(onnx_model).quantize(
+                save_dir=dest, quantization_config=qconfig
+            )
+
+        # HF snapshot directories are named after the revision's commit hash
+        key = f"sentiment-int8/{Path(model_path).name}/{'vnni' if vnni else 'avx2'}"
+        try:
+            quantized_dir = get_cache().put_dir("artifacts", key, quantize)
+            quantized = ORTModelForSequenceClassification.from_pretrained(
+                quantized_dir, file_name=QUANTIZED_FILE
+            )
+            tokenizer = transformers.AutoTokenizer.from_pretrained(
+                model_path, use_fast=True
+            )
+        except Exception as e:
+            log.warning("int8_unavailable", model="sentiment", error=str(e))
+            return None
+        return transformers.pipeline(
+            "sentiment-analysis", model=quantized, tokenizer=tokenizer
         )
 
     def predict(self, inputs: list[TextInput]) -> list[SentimentOutput]:
         """Run sentiment analysis on input texts."""
         texts = [inp.text for inp in inputs]
-        results = self.pipeline(texts)
-        return [SentimentOutput(label=r["label"], score=r["score"]) for r in results]
+        # Run the whole request as one forward pass
+        results = self.pipeline(texts, batch_size=len(texts), truncation=True)
+        # Pipeline results are trusted, so build outputs without validation
+        return [
+            SentimentOutput.model_construct(label=r["label"], score=r["score"])
+            for r in results
+        ]
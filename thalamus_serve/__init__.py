@@ -24,44 +24,103 @@ Basic usage:
         app.serve()
 """
 
-from thalamus_serve.config import HFWeight, HTTPWeight, S3Weight, WeightSource
-from thalamus_serve.core.app import Thalamus
-from thalamus_serve.infra.cache import CacheStats, WeightCache
-from thalamus_serve.infra.gpu import (
-    DeviceInfo,
-    DeviceType,
-    GPURequirementError,
-    GPUStatus,
-    detect_devices,
-    get_optimal_device,
-)
-from thalamus_serve.infra.gpu import (
-    clear_cache as clear_gpu_cache,
-)
-from thalamus_serve.infra.gpu import (
-    get_memory as get_gpu_memory,
-)
-from thalamus_serve.infra.gpu import (
-    get_status as get_gpu_status,
-)
-from thalamus_serve.schemas.api import (
-    CacheClearResponse,
-    CacheInfo,
-    CapacityResponse,
-    HealthResponse,
-    ModelCapacity,
-    PredictRequest,
-    PredictResponse,
-    ReadyResponse,
-    SchemaResponse,
-    StatusResponse,
-    UnloadRequest,
-    UnloadResponse,
-)
-from thalamus_serve.schemas.common import Base64Data, BBox, Label, Prob, Span, Vector
-from thalamus_serve.schemas.storage import S3PresignedUrl, S3Ref, Url
-from thalamus_serve.storage.fetch import exists_s3, fetch, get_cache, upload_s3
-from thalamus_serve.utils import env, require_env
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from thalamus_serve.config import HFWeight, HTTPWeight, S3Weight, WeightSource
+    from thalamus_serve.core.app import Thalamus
+    from thalamus_serve.infra.cache import CacheStats, WeightCache
+    from thalamus_serve.infra.gpu import (
+        DeviceInfo,
+        DeviceType,
+        GPURequirementError,
+        GPUStatus,
+        detect_devices,
+        get_optimal_device,
+    )
+    from thalamus_serve.infra.gpu import (
+        clear_cache as clear_gpu_cache,
+    )
+    from thalamus_serve.infra.gpu import (
+        get_memory as get_gpu_memory,
+    )
+    from thalamus_serve.infra.gpu import (
+        get_status as get_gpu_status,
+    )
+    from thalamus_serve.schemas.api import (
+        CacheClearResponse,
+        CacheInfo,
+        CapacityResponse,
+        HealthResponse,
+        ModelCapacity,
+        PredictRequest,
+        PredictResponse,
+        ReadyResponse,
+        SchemaResponse,
+        StatusResponse,
+        UnloadRequest,
+        UnloadResponse,
+    )
+    from thalamus_serve.schemas.common import (
+        Base64Data,
+        BBox,
+        Label,
+        Prob,
+        Span,
+        Vector,
+    )
+    from thalamus_serve.schemas.storage import S3PresignedUrl, S3Ref, Url
+    from thalamus_serve.storage.fetch import exists_s3, fetch, get_cache, upload_s3
+    from thalamus_serve.utils import env, require_env
+
+# Public name -> (module, attribute). Submodules are imported on first access
+# (PEP 562), so `import thalamus_serve` stays cheap until something is used.
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "Thalamus": ("thalamus_serve.core.app", "Thalamus"),
+    "S3Weight": ("thalamus_serve.config", "S3Weight"),
+    "HFWeight": ("thalamus_serve.config", "HFWeight"),
+    "HTTPWeight": ("thalamus_serve.config", "HTTPWeight"),
+    "WeightSource": ("thalamus_serve.config", "WeightSource"),
+    "fetch": ("thalamus_serve.storage.fetch", "fetch"),
+    "upload_s3": ("thalamus_serve.storage.fetch", "upload_s3"),
+    "exists_s3": ("thalamus_serve.storage.fetch", "exists_s3"),
+    "get_cache": ("thalamus_serve.storage.fetch", "get_cache"),
+    "env": ("thalamus_serve.utils", "env"),
+    "require_env": ("thalamus_serve.utils", "require_env"),
+    "S3Ref": ("thalamus_serve.schemas.storage", "S3Ref"),
+    "S3PresignedUrl": ("thalamus_serve.schemas.storage", "S3PresignedUrl"),
+    "Url": ("thalamus_serve.schemas.storage", "Url"),
+    "Base64Data": ("thalamus_serve.schemas.common", "Base64Data"),
+    "BBox": ("thalamus_serve.schemas.common", "BBox"),
+    "Label": ("thalamus_serve.schemas.common", "Label"),
+    "Vector": ("thalamus_serve.schemas.common", "Vector"),
+    "Span": ("thalamus_serve.schemas.common", "Span"),
+    "Prob": ("thalamus_serve.schemas.common", "Prob"),
+    "HealthResponse": ("thalamus_serve.schemas.api", "HealthResponse"),
+    "ReadyResponse": ("thalamus_serve.schemas.api", "ReadyResponse"),
+    "SchemaResponse": ("thalamus_serve.schemas.api", "SchemaResponse"),
+    "PredictRequest": ("thalamus_serve.schemas.api", "PredictRequest"),
+    "PredictResponse": ("thalamus_serve.schemas.api", "PredictResponse"),
+    "StatusResponse": ("thalamus_serve.schemas.api", "StatusResponse"),
+    "CapacityResponse": ("thalamus_serve.schemas.api", "CapacityResponse"),
+    "ModelCapacity": ("thalamus_serve.schemas.api", "ModelCapacity"),
+    "CacheInfo": ("thalamus_serve.schemas.api", "CacheInfo"),
+    "CacheClearResponse": ("thalamus_serve.schemas.api", "CacheClearResponse"),
+    "UnloadRequest": ("thalamus_serve.schemas.api", "UnloadRequest"),
+    "UnloadResponse": ("thalamus_serve.schemas.api", "UnloadResponse"),
+    "WeightCache": ("thalamus_serve.infra.cache", "WeightCache"),
+    "CacheStats": ("thalamus_serve.infra.cache", "CacheStats"),
+    "DeviceType": ("thalamus_serve.infra.gpu", "DeviceType"),
+    "DeviceInfo": ("thalamus_serve.infra.gpu", "DeviceInfo"),
+    "GPUStatus": ("thalamus_serve.infra.gpu", "GPUStatus"),
+    "GPURequirementError": ("thalamus_serve.infra.gpu", "GPURequirementError"),
+    "detect_devices": ("thalamus_serve.infra.gpu", "detect_devices"),
+    "get_gpu_memory": ("thalamus_serve.infra.gpu", "get_memory"),
+    "clear_gpu_cache": ("thalamus_serve.infra.gpu", "clear_cache"),
+    "get_optimal_device": ("thalamus_serve.infra.gpu", "get_optimal_device"),
+    "get_gpu_status": ("thalamus_serve.infra.gpu", "get_status"),
+}
 
 __all__ = [
     "Thalamus",
@@ -108,3 +167,17 @@ __all__ = [
     "get_optimal_device",
     "get_gpu_status",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,7 @@
 """Weight source configuration types for model loading."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field, model_validator
 
 
@@ -20,7 +22,7 @@ class S3Weight(BaseModel, frozen=True):
         Sharded: S3Weight(bucket="models", prefix="llama/weights/")
     """
 
-    type: str = Field("s3", init=False)
+    type: Literal["s3"] = Field("s3", init=False)
     bucket: str
     key: str | None = None
     prefix: str | None = None
@@ -49,7 +51,7 @@ class HFWeight(BaseModel, frozen=True):
         revision: Git revision (branch, tag, or commit hash).
     """
 
-    type: str = Field("hf", init=False)
+    type: Literal["hf"] = Field("hf", init=False)
     repo: str
     filename: str | None = None
     revision: str = "main"
@@ -75,7 +77,7 @@ class HTTPWeight(BaseModel, frozen=True):
         ])
     """
 
-    type: str = Field("http", init=False)
+    type: Literal["http"] = Field("http", init=False)
     urls: tuple[str, ...]
 
     @model_validator(mode="after")
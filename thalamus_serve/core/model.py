@@ -1,14 +1,34 @@
 """Model specification and registry for managing registered models."""
 
+import bisect
+from dataclasses import dataclass, field
+from functools import cache
+from threading import Lock
 from typing import Any
 
 from packaging.version import Version
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from thalamus_serve.config import WeightSource
 from thalamus_serve.infra.gpu import GPUAllocator
 
 
+@cache
+def _inputs_adapter(input_type: type[BaseModel]) -> TypeAdapter[list[BaseModel]]:
+    """Validator for a whole /predict batch, built once per input type."""
+    return TypeAdapter(list[input_type])  # type: ignore[valid-type]
+
+
+@cache
+def _detect_hooks(model_cls: type) -> tuple[bool, bool, bool]:
+    """Which optional hooks a model class defines, checked once per class."""
+    return (
+        callable(getattr(model_cls, "preprocess", None)),
+        callable(getattr(model_cls, "postprocess", None)),
+        callable(getattr(model_cls, "capacity", None)),
+    )
+
+
 class ModelSpec:
     """Specification for a registered model including metadata and configuration."""
 
@@ -61,6 +81,8 @@ class ModelSpec:
         self.cls = cls
         self.input_type = input_type
         self.output_type = output_type
+        # Validates a whole /predict batch in one call
+        self.inputs_adapter = _inputs_adapter(input_type)
         self.has_preprocess = has_preprocess
         self.has_postprocess = has_postprocess
         self.is_default = is_default
@@ -124,15 +146,7 @@ class ModelSpec:
         mid = model_id or model_cls.__name__
         desc = description or model_cls.__doc__ or ""
 
-        has_preprocess = hasattr(model_cls, "preprocess") and callable(
-            getattr(model_cls, "preprocess", None)
-        )
-        has_postprocess = hasattr(model_cls, "postprocess") and callable(
-            getattr(model_cls, "postprocess", None)
-        )
-        has_capacity = hasattr(model_cls, "capacity") and callable(
-            getattr(model_cls, "capacity", None)
-        )
+        has_preprocess, has_postprocess, has_capacity = _detect_hooks(model_cls)
 
         return cls(
             model_id=mid,
@@ -156,52 +170,88 @@ class ModelSpec:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class _RegistrySnapshot:
+    """Immutable view of the registry; replaced wholesale on every register."""
+
+    models: dict[str, dict[str, ModelSpec]] = field(default_factory=dict)
+    # Versions per model in ascending order, kept sorted on register so
+    # lookups never re-parse version strings
+    sorted_versions: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    default_model: str | None = None
+    default_versions: dict[str, str] = field(default_factory=dict)
+    # Spec that get(model_id) resolves to, worked out once on register
+    resolved: dict[str, ModelSpec] = field(default_factory=dict)
+
+
 class ModelRegistry:
-    def __init__(self) -> None:
-        self._models: dict[str, dict[str, ModelSpec]] = {}
-        self._default_model: str | None = None
-        self._default_versions: dict[str, str] = {}
+    """Registered model specs, keyed by model id and version.
 
-    def register(self, spec: ModelSpec) -> None:
-        if spec.id not in self._models:
-            self._models[spec.id] = {}
-        self._models[spec.id][spec.version] = spec
+    Reads go through an immutable snapshot and take no lock. ``register``
+    builds a new snapshot under a write lock and publishes it with a single
+    attribute assignment, so readers see either the old or the new registry,
+    never a half-updated one.
+    """
 
-        if spec.is_default:
-            self._default_model = spec.id
+    def __init__(self) -> None:
+        self._snapshot = _RegistrySnapshot()
+        self._write_lock = Lock()
 
-        if spec.is_default_version:
-            self._default_versions[spec.id] = spec.version
+    def register(self, spec: ModelSpec) -> None:
+        with self._write_lock:
+            snap = self._snapshot
+            models = dict(snap.models)
+            model_versions = dict(models.get(spec.id, {}))
+            sorted_versions = dict(snap.sorted_versions)
+            if spec.version not in model_versions:
+                versions = list(sorted_versions.get(spec.id, ()))
+                bisect.insort(versions, spec.version, key=Version)
+                sorted_versions[spec.id] = tuple(versions)
+            model_versions[spec.version] = spec
+            models[spec.id] = model_versions
+
+            default_versions = snap.default_versions
+            if spec.is_default_version:
+                default_versions = {**default_versions, spec.id: spec.version}
+
+            version = default_versions.get(spec.id, sorted_versions[spec.id][-1])
+            resolved = {**snap.resolved, spec.id: model_versions[version]}
+
+            self._snapshot = _RegistrySnapshot(
+                models=models,
+                sorted_versions=sorted_versions,
+                default_model=spec.id if spec.is_default else snap.default_model,
+                default_versions=default_versions,
+                resolved=resolved,
+            )
 
     def get(self, model_id: str, version: str | None = None) -> ModelSpec | None:
-        model_versions = self._models.get(model_id)
-        if not model_versions:
-            return None
-
+        snap = self._snapshot
         if version is None or version == "latest":
-            version = self._resolve_default_version(model_id)
+            return snap.resolved.get(model_id)
 
+        model_versions = snap.models.get(model_id)
+        if not model_versions:
+            return None
         return model_versions.get(version)
 
     def get_default(self) -> ModelSpec | None:
-        if not self._default_model:
+        default_model = self._snapshot.default_model
+        if not default_model:
             return None
-        return self.get(self._default_model)
+        return self.get(default_model)
 
     def get_versions(self, model_id: str) -> list[str]:
-        model_versions = self._models.get(model_id)
-        if not model_versions:
-            return []
-        return sorted(model_versions.keys(), key=Version, reverse=True)
+        return list(reversed(self._snapshot.sorted_versions.get(model_id, ())))
 
     def all(self) -> list[ModelSpec]:
         result: list[ModelSpec] = []
-        for versions in self._models.values():
+        for versions in self._snapshot.models.values():
             result.extend(versions.values())
         return result
 
     def all_for_model(self, model_id: str) -> list[ModelSpec]:
-        model_versions = self._models.get(model_id)
+        model_versions = self._snapshot.models.get(model_id)
         if not model_versions:
             return []
         return list(model_versions.values())
@@ -233,10 +283,3 @@ class ModelRegistry:
                     unloaded.append(spec.version)
 
         return unloaded
-
-    def _resolve_default_version(self, model_id: str) -> str:
-        if model_id in self._default_versions:
-            return self._default_versions[model_id]
-
-        versions = self.get_versions(model_id)
-        return versions[0] if versions else ""
@@ -305,7 +305,7 @@ def create_routes(ctx: RouteContext) -> APIRouter:
         with ctx.track_inflight():
             ctx.ensure_loaded(m)
 
-            inputs = [m.input_type.model_validate(i) for i in req.inputs]
+            inputs = m.inputs_adapter.validate_python(req.inputs)
 
             preprocessing_ms: float | None = None
             postprocessing_ms: float | None = None
@@ -2,15 +2,51 @@
 
 import hashlib
 import os
+import shutil
+import stat
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from threading import Lock
+from typing import Literal
 
-from pydantic import BaseModel, computed_field
+# Written into a cached directory once its download has finished
+COMPLETE_MARKER = ".complete"
 
+# Subdirectories holding multi-file downloads, one directory per cache key.
+# "artifacts" holds files derived from weights at load time (exported or
+# quantized models, compiled engines) so they share the cache budget.
+_DIR_NAMESPACES = ("s3_prefixes", "http_urls", "artifacts")
 
-class CacheStats(BaseModel, frozen=True):
-    """Statistics about cache usage and performance."""
+# Subdirectory huggingface_hub manages, one ``models--*`` directory per repo
+HF_CACHE_DIR = "huggingface"
+
+# Share of the cache the SLRU protected segment may fill
+_PROTECTED_FRACTION = 0.8
+
+CachePolicy = Literal["lru", "slru", "lru-sp"]
+
+
+@lru_cache(maxsize=4096)
+def _key_hash(key: str) -> str:
+    """Short fingerprint naming a key's cache entry on disk.
+
+    Part of the on-disk layout, so the hash must not change between releases.
+    The same keys are looked up on every request, so results are memoized.
+    """
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Statistics about cache usage and performance.
+
+    A plain dataclass: the values come straight from the cache and never need
+    validation, and ``/status`` copies them into its own response model.
+    """
 
     total_size_bytes: int
     file_count: int
@@ -18,42 +54,319 @@ class CacheStats(BaseModel, frozen=True):
     hit_count: int
     miss_count: int
 
-    @computed_field  # type: ignore[prop-decorator]
     @property
     def hit_rate(self) -> float:
         total = self.hit_count + self.miss_count
         return self.hit_count / total if total > 0 else 0.0
 
 
+@dataclass(slots=True)
+class _Entry:
+    """In-memory record of a cached file or directory."""
+
+    path: Path
+    size: int
+    files: int
+    is_dir: bool
+
+
+class _LRUPolicy:
+    """Eviction order for plain LRU: the least recently used entry goes first."""
+
+    def __init__(self, max_size_bytes: int) -> None:
+        self._order: OrderedDict[str, _Entry] = OrderedDict()
+
+    def admit(self, name: str, entry: _Entry) -> None:
+        self._order[name] = entry
+
+    def hit(self, name: str) -> None:
+        self._order.move_to_end(name)
+
+    def remove(self, name: str) -> None:
+        self._order.pop(name, None)
+
+    def victim(self) -> str | None:
+        return next(iter(self._order), None)
+
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class _SLRUPolicy(_LRUPolicy):
+    """Eviction order for segmented LRU.
+
+    New entries start in a probationary segment (the inherited LRU order) and
+    move to a protected segment when they are hit again. Eviction drains the
+    probationary segment first, so a burst of one-off downloads cannot push
+    out weights that are being reused. The protected segment is capped at a
+    share of the cache; entries it overflows are demoted back to probation.
+    """
+
+    def __init__(self, max_size_bytes: int) -> None:
+        super().__init__(max_size_bytes)
+        self._protected: OrderedDict[str, _Entry] = OrderedDict()
+        self._protected_size = 0
+        self._protected_max = int(max_size_bytes * _PROTECTED_FRACTION)
+
+    def hit(self, name: str) -> None:
+        if name in self._protected:
+            self._protected.move_to_end(name)
+            return
+        entry = self._order.pop(name)
+        self._protected[name] = entry
+        self._protected_size += entry.size
+        while self._protected_size > self._protected_max and len(self._protected) > 1:
+            demoted_name, demoted = self._protected.popitem(last=False)
+            self._protected_size -= demoted.size
+            self._order[demoted_name] = demoted
+
+    def remove(self, name: str) -> None:
+        entry = self._protected.pop(name, None)
+        if entry is None:
+            super().remove(name)
+        else:
+            self._protected_size -= entry.size
+
+    def victim(self) -> str | None:
+        name = super().victim()
+        return name if name is not None else next(iter(self._protected), None)
+
+    def clear(self) -> None:
+        super().clear()
+        self._protected.clear()
+        self._protected_size = 0
+
+
+class _LRUSPPolicy(_LRUPolicy):
+    """Eviction order for LRU-SP (size- and popularity-aware LRU).
+
+    Evicts the entry with the highest ``age * size / references``, so a large
+    weight fetched once goes before small files that keep being reused. Age
+    is counted in cache accesses rather than wall-clock time.
+    """
+
+    def __init__(self, max_size_bytes: int) -> None:
+        super().__init__(max_size_bytes)
+        self._clock = 0
+        self._last_access: dict[str, int] = {}
+        self._references: dict[str, int] = {}
+
+    def admit(self, name: str, entry: _Entry) -> None:
+        super().admit(name, entry)
+        self._clock += 1
+        self._last_access[name] = self._clock
+        self._references[name] = 1
+
+    def hit(self, name: str) -> None:
+        super().hit(name)
+        self._clock += 1
+        self._last_access[name] = self._clock
+        self._references[name] += 1
+
+    def remove(self, name: str) -> None:
+        super().remove(name)
+        self._last_access.pop(name, None)
+        self._references.pop(name, None)
+
+    def victim(self) -> str | None:
+        victim, highest = None, -1.0
+        for name, entry in self._order.items():
+            age = self._clock - self._last_access[name]
+            cost = age * entry.size / self._references[name]
+            if cost > highest:
+                victim, highest = name, cost
+        return victim
+
+    def clear(self) -> None:
+        super().clear()
+        self._last_access.clear()
+        self._references.clear()
+
+
+_POLICIES: dict[str, type[_LRUPolicy]] = {
+    "lru": _LRUPolicy,
+    "slru": _SLRUPolicy,
+    "lru-sp": _LRUSPPolicy,
+}
+
+
+def _scandir(path: Path | str) -> list[os.DirEntry[str]]:
+    """List a directory, treating a missing one as empty.
+
+    ``DirEntry`` answers ``is_file()``/``is_dir()`` from the directory read
+    itself, so only the entries whose size is needed cost a ``stat`` call.
+    """
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except FileNotFoundError:
+        return []
+
+
+def _measure_dir(path: Path | str) -> tuple[int, int]:
+    """Total size and number of files under a cached directory.
+
+    Symlinks are skipped, so HuggingFace snapshot links are not counted on top
+    of the blobs they point to.
+    """
+    size = files = 0
+    for entry in _scandir(path):
+        if entry.is_dir(follow_symlinks=False):
+            sub_size, sub_files = _measure_dir(entry.path)
+            size += sub_size
+            files += sub_files
+        elif entry.is_file(follow_symlinks=False) and entry.name != COMPLETE_MARKER:
+            size += entry.stat(follow_symlinks=False).st_size
+            files += 1
+    return size, files
+
+
 class WeightCache:
     """Thread-safe LRU file cache for model weights.
 
     Caches downloaded model weights to disk with automatic eviction when
     the cache exceeds the configured maximum size. Uses LRU (least recently
-    used) eviction based on file access times.
+    used) eviction by default. Segmented LRU instead keeps entries that were
+    hit more than once ahead of one-off downloads, and LRU-SP weighs recency
+    against size and reuse so large, rarely used weights go first. Single
+    files live directly in the cache directory; multi-file downloads (S3
+    prefixes, sharded HTTP URLs) are cached as whole directories under a
+    namespace subdirectory.
+
+    Cached files and directories are tracked in an in-memory index built once
+    from the cache directory at construction, so lookups and size accounting
+    never touch the filesystem. Recency is tracked in memory, so it does not
+    depend on file access times, which ``noatime`` mounts never update. The
+    index assumes this process owns the cache directory; entries another
+    process adds are adopted on the first lookup that misses.
 
     Args:
         cache_dir: Directory to store cached files.
         max_size_gb: Maximum cache size in gigabytes before eviction triggers.
+        policy: Eviction policy, ``"lru"``, ``"slru"``, or ``"lru-sp"``.
+
+    Raises:
+        ValueError: If policy is not a known eviction policy.
     """
 
-    def __init__(self, cache_dir: Path, max_size_gb: float = 50.0) -> None:
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_gb: float = 50.0,
+        policy: CachePolicy = "lru",
+    ) -> None:
+        if policy not in _POLICIES:
+            raise ValueError(
+                f"Unknown cache policy {policy!r}, expected one of {list(_POLICIES)}"
+            )
         self._cache_dir = cache_dir
         self._max_size_bytes = int(max_size_gb * 1e9)
+        self._policy = _POLICIES[policy](self._max_size_bytes)
         self._lock = Lock()
         self._hit_count = 0
         self._miss_count = 0
+        self._entries: dict[str, _Entry] = {}
+        self._total_size = 0
+        self._file_count = 0
+        self._pending: dict[str, Future[Path]] = {}
         self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._scan()
 
     @property
     def cache_dir(self) -> Path:
         return self._cache_dir
 
     def _key_to_path(self, key: str) -> Path:
-        key_hash = hashlib.sha256(key.encode()).hexdigest()[:16]
+        key_hash = _key_hash(key)
         filename = os.path.basename(key) or key_hash
         return self._cache_dir / f"{key_hash}_{filename}"
 
+    def _key_to_dir(self, namespace: str, key: str) -> Path:
+        # Other subdirectories would be skipped by the startup scan and clear()
+        if namespace not in _DIR_NAMESPACES:
+            raise ValueError(
+                f"Unknown cache namespace {namespace!r}, "
+                f"expected one of {_DIR_NAMESPACES}"
+            )
+        return self._cache_dir / namespace / _key_hash(key)
+
+    def _scan(self) -> None:
+        """Index the files and directories already in the cache directory.
+
+        Access times from a previous run seed the initial recency order.
+        Directories without a completion marker are unfinished downloads and
+        are not indexed.
+        """
+        found: list[tuple[float, Path, int, int, bool]] = []
+        for f in _scandir(self._cache_dir):
+            if f.is_file(follow_symlinks=False) and not f.name.endswith(".tmp"):
+                st = f.stat(follow_symlinks=False)
+                found.append((st.st_atime, Path(f.path), st.st_size, 1, False))
+        for namespace in _DIR_NAMESPACES:
+            for d in _scandir(self._cache_dir / namespace):
+                if d.is_dir(follow_symlinks=False) and os.path.exists(
+                    os.path.join(d.path, COMPLETE_MARKER)
+                ):
+                    size, files = _measure_dir(d.path)
+                    atime = d.stat(follow_symlinks=False).st_atime
+                    found.append((atime, Path(d.path), size, files, True))
+        for d in _scandir(self._cache_dir / HF_CACHE_DIR):
+            if d.name.startswith("models--") and d.is_dir(follow_symlinks=False):
+                size, files = _measure_dir(d.path)
+                atime = d.stat(follow_symlinks=False).st_atime
+                found.append((atime, Path(d.path), size, files, True))
+        found.sort(key=lambda item: item[0])
+        for _, path, size, files, is_dir in found:
+            self._add(path, size, files, is_dir)
+
+    def _add(self, path: Path, size: int, files: int, is_dir: bool) -> _Entry:
+        entry = _Entry(path, size, files, is_dir)
+        replaced = self._entries.pop(str(path), None)
+        if replaced is not None:
+            self._policy.remove(str(path))
+            self._total_size -= replaced.size
+            self._file_count -= replaced.files
+        self._entries[str(path)] = entry
+        self._policy.admit(str(path), entry)
+        self._total_size += size
+        self._file_count += files
+        return entry
+
+    def _lookup(self, path: Path, is_dir: bool) -> _Entry | None:
+        """Find the index entry for a cache path without taking the lock.
+
+        Single dict reads are atomic, so indexed entries are found lock-free.
+        Only a miss touches the disk, to adopt an entry this process did not
+        write itself, and only adopting one takes the lock.
+        """
+        entry = self._entries.get(str(path))
+        if entry is not None:
+            return entry
+        if is_dir:
+            if not (path / COMPLETE_MARKER).exists():
+                return None
+            size, files = _measure_dir(path)
+        else:
+            try:
+                st = path.stat()
+            except OSError:
+                return None
+            if not stat.S_ISREG(st.st_mode):
+                return None
+            size, files = st.st_size, 1
+        with self._lock:
+            entry = self._entries.get(str(path))
+            if entry is None:
+                entry = self._add(path, size, files, is_dir)
+        return entry
+
+    def _record_hit(self, entry: _Entry) -> None:
+        with self._lock:
+            self._hit_count += 1
+            # The entry may have been evicted since the lock-free lookup
+            if self._entries.get(str(entry.path)) is entry:
+                self._policy.hit(str(entry.path))
+
     def get(self, key: str) -> Path | None:
         """Get a cached file by key.
 
@@ -63,20 +376,37 @@ class WeightCache:
         Returns:
             Path to cached file if it exists, None otherwise.
         """
-        with self._lock:
-            path = self._key_to_path(key)
-            if path.exists():
-                self._hit_count += 1
-                path.touch()
-                return path
-            self._miss_count += 1
+        return self._get(self._key_to_path(key), is_dir=False)
+
+    def get_dir(self, namespace: str, key: str) -> Path | None:
+        """Get a cached directory by key.
+
+        Args:
+            namespace: Subdirectory of the cache the directory lives in.
+            key: Cache key (typically a URL or identifier).
+
+        Returns:
+            Path to the cached directory if it is complete, None otherwise.
+        """
+        return self._get(self._key_to_dir(namespace, key), is_dir=True)
+
+    def _get(self, path: Path, is_dir: bool) -> Path | None:
+        entry = self._lookup(path, is_dir)
+        if entry is None:
+            with self._lock:
+                self._miss_count += 1
             return None
+        self._record_hit(entry)
+        return entry.path
 
     def put(self, key: str, download_fn: Callable[[Path], None]) -> Path:
         """Get or download a file into the cache.
 
         If the key exists in cache, returns the cached path. Otherwise,
         calls download_fn to download the file, caches it, and returns the path.
+        The download runs without holding the cache lock; concurrent callers
+        for the same key wait for the first caller's download instead of
+        starting their own.
 
         Args:
             key: Cache key (typically a URL or identifier).
@@ -88,236 +418,160 @@ class WeightCache:
         Raises:
             Exception: If download_fn raises an exception.
         """
-        with self._lock:
-            path = self._key_to_path(key)
-            if path.exists():
-                self._hit_count += 1
-                path.touch()
-                return path
-
-            self._miss_count += 1
-            self._evict_if_needed()
-
-            temp_path = path.with_suffix(".tmp")
-            try:
-                download_fn(temp_path)
-                temp_path.rename(path)
-            except Exception:
-                if temp_path.exists():
-                    temp_path.unlink(missing_ok=True)
-                raise
-            return path
-
-    def contains(self, key: str) -> bool:
-        """Check if a key exists in the cache."""
-        with self._lock:
-            return self._key_to_path(key).exists()
-
-    def _get_thalamus_size(self) -> int:
-        """Get total size of thalamus cache files (S3, HTTP downloads)."""
-        return sum(f.stat().st_size for f in self._cache_dir.iterdir() if f.is_file())
-
-    def _get_s3_prefix_size(self) -> int:
-        """Get total size of S3 prefix directories (sharded model downloads)."""
-        prefix_dir = self._cache_dir / "s3_prefixes"
-        if not prefix_dir.exists():
-            return 0
-        total = 0
-        for prefix_cache in prefix_dir.iterdir():
-            if prefix_cache.is_dir():
-                for f in prefix_cache.rglob("*"):
-                    if f.is_file():
-                        total += f.stat().st_size
-        return total
-
-    def _get_http_urls_size(self) -> int:
-        """Get total size of HTTP URL directories (sharded model downloads)."""
-        urls_dir = self._cache_dir / "http_urls"
-        if not urls_dir.exists():
-            return 0
-        total = 0
-        for url_cache in urls_dir.iterdir():
-            if url_cache.is_dir():
-                for f in url_cache.rglob("*"):
-                    if f.is_file():
-                        total += f.stat().st_size
-        return total
-
-    def _get_hf_size(self) -> int:
-        """Get total size of HuggingFace blobs."""
-        hf_dir = self._cache_dir / "huggingface"
-        if not hf_dir.exists():
-            return 0
-        total = 0
-        for model_dir in hf_dir.iterdir():
-            if model_dir.is_dir() and model_dir.name.startswith("models--"):
-                blobs_dir = model_dir / "blobs"
-                if blobs_dir.exists():
-                    for blob in blobs_dir.iterdir():
-                        if blob.is_file():
-                            total += blob.stat().st_size
-        return total
-
-    def _get_size(self) -> int:
-        """Get total cache size including all sources."""
-        return (
-            self._get_thalamus_size()
-            + self._get_s3_prefix_size()
-            + self._get_http_urls_size()
-            + self._get_hf_size()
-        )
+        return self._put(self._key_to_path(key), download_fn, is_dir=False)
 
-    def _evict_thalamus_files(self, target_bytes: int) -> int:
-        """Evict thalamus cache files (S3 single files, HTTP) using LRU."""
-        files = [
-            (f, f.stat())
-            for f in self._cache_dir.iterdir()
-            if f.is_file() and f.suffix != ".tmp"
-        ]
-        files.sort(key=lambda x: x[1].st_atime)
+    def put_dir(
+        self, namespace: str, key: str, download_fn: Callable[[Path], None]
+    ) -> Path:
+        """Get or download a directory into the cache.
 
-        freed = 0
-        for file_path, stat in files:
-            if self._get_size() <= target_bytes:
-                break
-            try:
-                freed += stat.st_size
-                file_path.unlink()
-            except OSError:
-                pass
+        Like :meth:`put`, but download_fn fills the given (already created)
+        directory. The directory is marked complete once download_fn returns
+        and is removed if it raises. Besides downloads, download_fn may build
+        the directory locally: models can cache exported or compiled artifacts
+        under the ``"artifacts"`` namespace so they count toward the cache
+        size and are evicted and cleared like weights.
 
-        return freed
+        Args:
+            namespace: Subdirectory of the cache the directory lives in, one
+                of ``"s3_prefixes"``, ``"http_urls"`` or ``"artifacts"``.
+            key: Cache key (typically a URL or identifier).
+            download_fn: Function that downloads content into the given directory.
 
-    def _evict_s3_prefixes(self, target_bytes: int) -> int:
-        """Evict S3 prefix directories using LRU."""
-        import shutil
+        Returns:
+            Path to the cached directory.
 
-        prefix_dir = self._cache_dir / "s3_prefixes"
-        if not prefix_dir.exists():
-            return 0
+        Raises:
+            ValueError: If namespace is not a known cache namespace.
+            Exception: If download_fn raises an exception.
+        """
+        return self._put(self._key_to_dir(namespace, key), download_fn, is_dir=True)
 
-        # Get directories with their access times
-        dirs = []
-        for d in prefix_dir.iterdir():
-            if d.is_dir():
-                try:
-                    dirs.append((d, d.stat().st_atime))
-                except OSError:
-                    pass
+    def _put(
+        self, path: Path, download_fn: Callable[[Path], None], is_dir: bool
+    ) -> Path:
+        entry = self._lookup(path, is_dir)
+        if entry is not None:
+            self._record_hit(entry)
+            return entry.path
 
-        dirs.sort(key=lambda x: x[1])  # Sort by access time (oldest first)
+        with self._lock:
+            entry = self._entries.get(str(path))
+            if entry is not None:
+                self._hit_count += 1
+                self._policy.hit(str(path))
+                return entry.path
 
-        freed = 0
-        for dir_path, _ in dirs:
-            if self._get_size() <= target_bytes:
-                break
-            try:
-                # Calculate directory size before deletion
-                dir_size = sum(
-                    f.stat().st_size for f in dir_path.rglob("*") if f.is_file()
-                )
-                shutil.rmtree(dir_path)
-                freed += dir_size
-            except OSError:
-                pass
+            pending = self._pending.get(str(path))
+            if pending is not None:
+                self._hit_count += 1
+            else:
+                self._miss_count += 1
+                self._pending[str(path)] = Future()
+                self._evict_if_needed()
+
+        if pending is not None:
+            return pending.result()
+        if is_dir:
+            return self._download_dir(path, download_fn)
+        return self._download(path, download_fn)
+
+    def _download(self, path: Path, download_fn: Callable[[Path], None]) -> Path:
+        """Run a reserved file download and publish it to waiting callers."""
+        temp_path = path.with_suffix(".tmp")
+        try:
+            download_fn(temp_path)
+            temp_path.rename(path)
+            size = path.stat().st_size
+        except BaseException as e:
+            temp_path.unlink(missing_ok=True)
+            self._fail(path, e)
+            raise
+        return self._commit(path, size, 1, is_dir=False)
+
+    def _download_dir(self, path: Path, download_fn: Callable[[Path], None]) -> Path:
+        """Run a reserved directory download and publish it to waiting callers."""
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            download_fn(path)
+            size, files = _measure_dir(path)
+            (path / COMPLETE_MARKER).touch()
+        except BaseException as e:
+            shutil.rmtree(path, ignore_errors=True)
+            self._fail(path, e)
+            raise
+        return self._commit(path, size, files, is_dir=True)
+
+    def _commit(self, path: Path, size: int, files: int, is_dir: bool) -> Path:
+        with self._lock:
+            self._add(path, size, files, is_dir)
+            pending = self._pending.pop(str(path))
+        pending.set_result(path)
+        return path
 
-        return freed
+    def _fail(self, path: Path, error: BaseException) -> None:
+        with self._lock:
+            pending = self._pending.pop(str(path))
+        pending.set_exception(error)
 
-    def _evict_http_urls(self, target_bytes: int) -> int:
-        """Evict HTTP URL directories using LRU."""
-        import shutil
+    def contains(self, key: str) -> bool:
+        """Check if a key exists in the cache."""
+        return self._lookup(self._key_to_path(key), is_dir=False) is not None
 
-        urls_dir = self._cache_dir / "http_urls"
-        if not urls_dir.exists():
-            return 0
+    def track_dir(self, path: Path) -> Path:
+        """Index a directory another downloader wrote into the cache.
 
-        # Get directories with their access times
-        dirs = []
-        for d in urls_dir.iterdir():
-            if d.is_dir():
-                try:
-                    dirs.append((d, d.stat().st_atime))
-                except OSError:
-                    pass
+        HuggingFace repositories are downloaded and laid out by huggingface_hub
+        itself; tracking the repository directory afterwards makes it count
+        toward the size budget and lets eviction remove it like any other
+        entry. Tracking it again refreshes its size and recency.
 
-        dirs.sort(key=lambda x: x[1])  # Sort by access time (oldest first)
+        Args:
+            path: Directory inside the cache directory.
 
+        Returns:
+            The tracked directory.
+        """
+        size, files = _measure_dir(path)
+        with self._lock:
+            entry = self._entries.get(str(path))
+            if entry is None:
+                self._evict_if_needed()
+                self._add(path, size, files, is_dir=True)
+            else:
+                if (entry.size, entry.files) != (size, files):
+                    self._add(path, size, files, is_dir=True)
+                self._policy.hit(str(path))
+        return path
+
+    def _evict_entries(self, excess_bytes: int) -> int:
+        """Evict indexed files and directories in the policy's order."""
         freed = 0
-        for dir_path, _ in dirs:
-            if self._get_size() <= target_bytes:
+        while freed < excess_bytes:
+            name = self._policy.victim()
+            if name is None:
                 break
+            self._policy.remove(name)
+            entry = self._entries.pop(name)
+            self._total_size -= entry.size
+            self._file_count -= entry.files
             try:
-                # Calculate directory size before deletion
-                dir_size = sum(
-                    f.stat().st_size for f in dir_path.rglob("*") if f.is_file()
-                )
-                shutil.rmtree(dir_path)
-                freed += dir_size
+                if entry.is_dir:
+                    shutil.rmtree(entry.path)
+                else:
+                    entry.path.unlink(missing_ok=True)
             except OSError:
-                pass
-
-        return freed
-
-    def _evict_hf_if_needed(self, target_bytes: int) -> int:
-        """Evict HuggingFace cache entries using HF's cache manager."""
-        hf_dir = self._cache_dir / "huggingface"
-        if not hf_dir.exists():
-            return 0
-
-        try:
-            from huggingface_hub import scan_cache_dir
-        except ImportError:
-            return 0
-
-        try:
-            cache_info = scan_cache_dir(hf_dir)
-        except Exception:
-            return 0
-
-        # Sort repos by last accessed time (oldest first)
-        repos = sorted(cache_info.repos, key=lambda r: r.last_accessed)
-
-        freed = 0
-        for repo in repos:
-            if self._get_size() <= target_bytes:
-                break
-            try:
-                # Get all revisions for this repo and delete them
-                revision_hashes = [rev.commit_hash for rev in repo.revisions]
-                if revision_hashes:
-                    strategy = cache_info.delete_revisions(*revision_hashes)
-                    freed += strategy.expected_freed_size
-                    strategy.execute()
-            except Exception:
-                pass
+                continue
+            freed += entry.size
 
         return freed
 
     def _evict_if_needed(self) -> int:
         """Evict cache entries if over size limit."""
-        current_size = self._get_size()
-        if current_size <= self._max_size_bytes:
+        if self._total_size <= self._max_size_bytes:
             return 0
-
         target_size = int(self._max_size_bytes * 0.8)
-        freed = 0
-
-        # First evict thalamus cache files (S3 single files, HTTP single files)
-        freed += self._evict_thalamus_files(target_size)
-
-        # Then evict S3 prefix directories
-        if self._get_size() > target_size:
-            freed += self._evict_s3_prefixes(target_size)
-
-        # Then evict HTTP URL directories
-        if self._get_size() > target_size:
-            freed += self._evict_http_urls(target_size)
-
-        # Finally evict HF cache
-        if self._get_size() > target_size:
-            freed += self._evict_hf_if_needed(target_size)
-
-        return freed
+        return self._evict_entries(self._total_size - target_size)
 
     def clear(self) -> tuple[int, int]:
         """Clear all cached files including subdirectories.
@@ -328,73 +582,66 @@ class WeightCache:
         Returns:
             Tuple of (bytes_freed, files_deleted).
         """
-        import shutil
-
         with self._lock:
             total_bytes = 0
             total_files = 0
 
+            # Skip the targets of downloads in flight (and their temp files)
+            in_flight = set(self._pending)
+            in_flight.update(str(Path(p).with_suffix(".tmp")) for p in self._pending)
+
             # Clear files directly in cache directory
-            for f in self._cache_dir.iterdir():
-                if f.is_file():
+            for f in _scandir(self._cache_dir):
+                if f.is_file(follow_symlinks=False) and f.path not in in_flight:
                     try:
-                        total_bytes += f.stat().st_size
-                        f.unlink()
-                        total_files += 1
+                        size = f.stat(follow_symlinks=False).st_size
+                        os.unlink(f.path)
                     except OSError:
-                        pass
-
-            # Clear S3 prefix directories
-            s3_prefix_dir = self._cache_dir / "s3_prefixes"
-            if s3_prefix_dir.exists():
-                for d in s3_prefix_dir.iterdir():
-                    if d.is_dir():
+                        continue
+                    total_bytes += size
+                    total_files += 1
+
+            # Clear S3 prefix and HTTP URL directories
+            for namespace in _DIR_NAMESPACES:
+                for d in _scandir(self._cache_dir / namespace):
+                    if d.is_dir(follow_symlinks=False) and d.path not in in_flight:
+                        size, files = _measure_dir(d.path)
                         try:
-                            for f in d.rglob("*"):
-                                if f.is_file():
-                                    total_bytes += f.stat().st_size
-                                    total_files += 1
-                            shutil.rmtree(d)
+                            shutil.rmtree(d.path)
                         except OSError:
-                            pass
-
-            # Clear HTTP URL directories
-            http_urls_dir = self._cache_dir / "http_urls"
-            if http_urls_dir.exists():
-                for d in http_urls_dir.iterdir():
-                    if d.is_dir():
-                        try:
-                            for f in d.rglob("*"):
-                                if f.is_file():
-                                    total_bytes += f.stat().st_size
-                                    total_files += 1
-                            shutil.rmtree(d)
-                        except OSError:
-                            pass
+                            continue
+                        total_bytes += size
+                        total_files += files
 
             # Clear HuggingFace cache
-            hf_dir = self._cache_dir / "huggingface"
+            hf_dir = self._cache_dir / HF_CACHE_DIR
             if hf_dir.exists():
+                size, files = _measure_dir(hf_dir)
                 try:
-                    for f in hf_dir.rglob("*"):
-                        if f.is_file():
-                            total_bytes += f.stat().st_size
-                            total_files += 1
                     shutil.rmtree(hf_dir)
+                    total_bytes += size
+                    total_files += files
                 except OSError:
                     pass
 
+            self._entries.clear()
+            self._policy.clear()
+            self._total_size = 0
+            self._file_count = 0
             self._hit_count = 0
             self._miss_count = 0
             return (total_bytes, total_files)
 
     def stats(self) -> CacheStats:
-        """Get cache statistics including size, file count, and hit rate."""
-        with self._lock:
-            return CacheStats(
-                total_size_bytes=self._get_size(),
-                file_count=sum(1 for f in self._cache_dir.iterdir() if f.is_file()),
-                max_size_bytes=self._max_size_bytes,
-                hit_count=self._hit_count,
-                miss_count=self._miss_count,
-            )
+        """Get cache statistics including size, file count, and hit rate.
+
+        Reads the counters without taking the lock, so a snapshot taken during
+        concurrent lookups may be off by the requests still in flight.
+        """
+        return CacheStats(
+            total_size_bytes=self._total_size,
+            file_count=self._file_count,
+            max_size_bytes=self._max_size_bytes,
+            hit_count=self._hit_count,
+            miss_count=self._miss_count,
+        )
@@ -2,15 +2,19 @@
 
 import os
 import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
 import boto3
 import httpx
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from huggingface_hub import hf_hub_download, snapshot_download
 
 from thalamus_serve.config import HFWeight, HTTPWeight, S3Weight, WeightSource
-from thalamus_serve.infra.cache import WeightCache
+from thalamus_serve.infra.cache import HF_CACHE_DIR, CachePolicy, WeightCache
 from thalamus_serve.observability.logging import log
 from thalamus_serve.schemas.storage import S3Ref
 
@@ -18,7 +22,18 @@ if TYPE_CHECKING:
     from mypy_boto3_s3 import S3Client
 
 _cache: WeightCache | None = None
-_thread_local = threading.local()
+_s3: "S3Client | None" = None
+_s3_lock = threading.Lock()
+
+# Large S3 objects are fetched as parallel multipart ranges
+_S3_TRANSFER = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024, max_concurrency=16, use_threads=True
+)
+
+# HTTP downloads at least this large are split into parallel Range requests
+_PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+_PARALLEL_CONNECTIONS = 8
+_CHUNK_BYTES = 1024 * 1024
 
 
 def _get_cache() -> WeightCache:
@@ -26,7 +41,8 @@ def _get_cache() -> WeightCache:
     if _cache is None:
         cache_dir = Path(os.environ.get("THALAMUS_CACHE_DIR", "/tmp/thalamus"))
         max_size_gb = float(os.environ.get("THALAMUS_CACHE_MAX_GB", "50"))
-        _cache = WeightCache(cache_dir, max_size_gb)
+        policy = cast(CachePolicy, os.environ.get("THALAMUS_CACHE_POLICY", "lru"))
+        _cache = WeightCache(cache_dir, max_size_gb, policy)
     return _cache
 
 
@@ -36,9 +52,17 @@ def get_cache() -> WeightCache:
 
 
 def _s3_client() -> "S3Client":
-    if not hasattr(_thread_local, "s3_client"):
-        _thread_local.s3_client = boto3.client("s3")
-    return _thread_local.s3_client
+    """Shared S3 client, created on first use.
+
+    boto3 clients are thread-safe and costly to build, so every thread uses
+    this one. The pool is sized for several transfers running in parallel.
+    """
+    global _s3
+    if _s3 is None:
+        with _s3_lock:
+            if _s3 is None:
+                _s3 = boto3.client("s3", config=Config(max_pool_connections=64))
+    return _s3
 
 
 def fetch_weight(source: WeightSource) -> Path:
@@ -54,13 +78,10 @@ def fetch_weight(source: WeightSource) -> Path:
     Returns:
         Path to the downloaded/cached weight file or directory.
     """
-    if isinstance(source, S3Weight):
-        return _fetch_s3_weight(source)
-    if isinstance(source, HFWeight):
-        return _fetch_hf_weight(source)
-    if isinstance(source, HTTPWeight):
-        return _fetch_http_weight(source)
-    raise ValueError(f"Unknown weight source type: {type(source)}")
+    fetcher = _WEIGHT_FETCHERS.get(getattr(source, "type", None))
+    if fetcher is None:
+        raise ValueError(f"Unknown weight source type: {type(source)}")
+    return fetcher(source)
 
 
 def _fetch_s3_weight(source: S3Weight) -> Path:
@@ -83,7 +104,9 @@ def _fetch_s3_weight(source: S3Weight) -> Path:
 
     def download(dest: Path) -> None:
         log.info("downloading", source=cache_key)
-        _s3_client().download_file(source.bucket, source.key, str(dest))
+        _s3_client().download_file(
+            source.bucket, source.key, str(dest), Config=_S3_TRANSFER
+        )
         log.info(
             "downloaded",
             source=cache_key,
@@ -95,62 +118,53 @@ def _fetch_s3_weight(source: S3Weight) -> Path:
 
 def _fetch_s3_prefix(source: S3Weight) -> Path:
     """Fetch all files under an S3 prefix (directory download for sharded models)."""
-    import hashlib
-
     assert source.prefix is not None, "prefix must be set for _fetch_s3_prefix"
     prefix = source.prefix
     cache_key = f"s3://{source.bucket}/{prefix}"
     weight_cache = _get_cache()
 
-    # Create a stable directory name based on the prefix
-    prefix_hash = hashlib.sha256(cache_key.encode()).hexdigest()[:16]
-    cache_dir = weight_cache.cache_dir / "s3_prefixes" / prefix_hash
-    marker_file = cache_dir / ".complete"
-
-    # Check if already downloaded
-    if marker_file.exists():
-        log.debug("cache_hit", source=cache_key, path=str(cache_dir))
-        cache_dir.touch()  # Update access time for LRU
-        return cache_dir
-
-    log.info("downloading_prefix", source=cache_key)
-
-    # List all objects under the prefix
-    client = _s3_client()
-    paginator = client.get_paginator("list_objects_v2")
-    pages = paginator.paginate(Bucket=source.bucket, Prefix=prefix)
-
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    total_size = 0
-    file_count = 0
-
-    for page in pages:
-        for obj in page.get("Contents", []):
-            obj_key = obj["Key"]
-            # Get relative path from prefix
-            relative_path = obj_key[len(prefix) :].lstrip("/")
-            if not relative_path:
-                continue
-
-            local_path = cache_dir / relative_path
-            local_path.parent.mkdir(parents=True, exist_ok=True)
-
-            log.debug("downloading_file", key=obj_key)
-            client.download_file(source.bucket, obj_key, str(local_path))
-            total_size += local_path.stat().st_size
-            file_count += 1
+    cached = weight_cache.get_dir("s3_prefixes", cache_key)
+    if cached:
+        log.debug("cache_hit", source=cache_key, path=str(cached))
+        return cached
 
-    # Mark as complete
-    marker_file.touch()
+    def download(dest: Path) -> None:
+        log.info("downloading_prefix", source=cache_key)
+
+        # List all objects under the prefix
+        client = _s3_client()
+        paginator = client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(Bucket=source.bucket, Prefix=prefix)
+
+        total_size = 0
+        file_count = 0
+
+        for page in pages:
+            for obj in page.get("Contents", []):
+                obj_key = obj["Key"]
+                # Get relative path from prefix
+                relative_path = obj_key[len(prefix) :].lstrip("/")
+                if not relative_path:
+                    continue
+
+                local_path = dest / relative_path
+                local_path.parent.mkdir(parents=True, exist_ok=True)
+
+                log.debug("downloading_file", key=obj_key)
+                client.download_file(
+                    source.bucket, obj_key, str(local_path), Config=_S3_TRANSFER
+                )
+                total_size += local_path.stat().st_size
+                file_count += 1
 
-    log.info(
-        "downloaded_prefix",
-        source=cache_key,
-        files=file_count,
-        size_mb=round(total_size / 1048576, 2),
-    )
+        log.info(
+            "downloaded_prefix",
+            source=cache_key,
+            files=file_count,
+            size_mb=round(total_size / 1048576, 2),
+        )
 
-    return cache_dir
+    return weight_cache.put_dir("s3_prefixes", cache_key, download)
 
 
 def _fetch_hf_weight(source: HFWeight) -> Path:
@@ -160,7 +174,8 @@ def _fetch_hf_weight(source: HFWeight) -> Path:
         Path to downloaded file (if filename specified) or directory (if snapshot).
     """
     token = os.environ.get("HF_TOKEN")
-    hf_cache_dir = _get_cache().cache_dir / "huggingface"
+    weight_cache = _get_cache()
+    hf_cache_dir = weight_cache.cache_dir / HF_CACHE_DIR
 
     log.info(
         "fetching_hf",
@@ -187,11 +202,9 @@ def _fetch_hf_weight(source: HFWeight) -> Path:
 
     result = Path(path)
 
-    # Touch path to update access time for LRU tracking
-    try:
-        result.touch()
-    except OSError:
-        pass
+    # huggingface_hub keeps one directory per repo; index it so it counts
+    # toward the cache budget and is evicted with everything else
+    weight_cache.track_dir(hf_cache_dir / f"models--{source.repo.replace('/', '--')}")
 
     log.info("fetched_hf", path=str(result), is_directory=result.is_dir())
     return result
@@ -212,51 +225,44 @@ def _fetch_http_weight(source: HTTPWeight) -> Path:
 
 def _fetch_http_urls(source: HTTPWeight) -> Path:
     """Fetch multiple files from HTTP URLs (for sharded models)."""
-    import hashlib
-
     urls = source.urls
     # Create cache key from sorted URLs for consistency
     cache_key = "http_multi:" + ",".join(sorted(urls))
-    key_hash = hashlib.sha256(cache_key.encode()).hexdigest()[:16]
-
     weight_cache = _get_cache()
-    cache_dir = weight_cache.cache_dir / "http_urls" / key_hash
-    marker_file = cache_dir / ".complete"
 
-    # Check if already downloaded
-    if marker_file.exists():
-        log.debug("cache_hit", source=f"http_urls[{len(urls)}]", path=str(cache_dir))
-        cache_dir.touch()  # Update access time for LRU
-        return cache_dir
+    cached = weight_cache.get_dir("http_urls", cache_key)
+    if cached:
+        log.debug("cache_hit", source=f"http_urls[{len(urls)}]", path=str(cached))
+        return cached
 
-    log.info("downloading_urls", count=len(urls))
+    def download(dest: Path) -> None:
+        log.info("downloading_urls", count=len(urls))
+        total_size = 0
 
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    total_size = 0
+        for url in urls:
+            # Extract filename from URL
+            filename = url.split("/")[-1].split("?")[0] or "file"
+            local_path = dest / filename
 
-    for url in urls:
-        # Extract filename from URL
-        filename = url.split("/")[-1].split("?")[0] or "file"
-        local_path = cache_dir / filename
+            log.debug("downloading_file", url=url)
+            _download_http(url, local_path, timeout=300.0)
+            total_size += local_path.stat().st_size
 
-        log.debug("downloading_file", url=url)
-        with httpx.stream("GET", url, timeout=300.0, follow_redirects=True) as r:
-            r.raise_for_status()
-            with open(local_path, "wb") as f:
-                for chunk in r.iter_bytes(8192):
-                    f.write(chunk)
-        total_size += local_path.stat().st_size
+        log.info(
+            "downloaded_urls",
+            files=len(urls),
+            size_mb=round(total_size / 1048576, 2),
+        )
 
-    # Mark as complete
-    marker_file.touch()
+    return weight_cache.put_dir("http_urls", cache_key, download)
 
-    log.info(
-        "downloaded_urls",
-        files=len(urls),
-        size_mb=round(total_size / 1048576, 2),
-    )
 
-    return cache_dir
+# Keyed by the sources' ``type`` tag, so dispatch is one dict lookup
+_WEIGHT_FETCHERS: dict[str | None, Callable[[Any], Path]] = {
+    "s3": _fetch_s3_weight,
+    "hf": _fetch_hf_weight,
+    "http": _fetch_http_weight,
+}
 
 
 def fetch(
@@ -297,7 +303,7 @@ def _fetch_s3(ref: S3Ref, filename: str | None, use_cache: bool) -> Path:
 
     def download(dest: Path) -> None:
         log.info("downloading", source=ref.uri)
-        _s3_client().download_file(ref.bucket, ref.key, str(dest))
+        _s3_client().download_file(ref.bucket, ref.key, str(dest), Config=_S3_TRANSFER)
         log.info(
             "downloaded",
             source=ref.uri,
@@ -319,11 +325,7 @@ def _fetch_http(url: str, use_cache: bool, timeout: float) -> Path:
 
     def download(dest: Path) -> None:
         log.info("downloading", source=url)
-        with httpx.stream("GET", url, timeout=timeout, follow_redirects=True) as r:
-            r.raise_for_status()
-            with open(dest, "wb") as f:
-                for chunk in r.iter_bytes(8192):
-                    f.write(chunk)
+        _download_http(url, dest, timeout)
         log.info(
             "downloaded", source=url, size_mb=round(dest.stat().st_size / 1048576, 2)
         )
@@ -331,6 +333,109 @@ def _fetch_http(url: str, use_cache: bool, timeout: float) -> Path:
     return weight_cache.put(cache_key, download)
 
 
+class _RangeNotSupportedError(Exception):
+    """The server ignored a Range request."""
+
+
+def _download_http(url: str, dest: Path, timeout: float) -> None:
+    """Download a URL to a file.
+
+    Large files from servers that accept byte ranges are fetched over several
+    parallel connections, since a single stream rarely fills a fast link.
+    Anything else, including servers that reject HEAD or ignore ``Range``,
+    is downloaded as one stream.
+    """
+    limits = httpx.Limits(max_connections=_PARALLEL_CONNECTIONS)
+    with httpx.Client(timeout=timeout, follow_redirects=True, limits=limits) as client:
+        if hasattr(os, "pwrite"):
+            try:
+                head = client.head(url, headers={"Accept-Encoding": "identity"})
+            except httpx.HTTPError:
+                head = None
+            if (
+                head is not None
+                and head.is_success
+                and head.headers.get("accept-ranges") == "bytes"
+                and "content-encoding" not in head.headers
+            ):
+                size = int(head.headers.get("content-length", 0))
+                if size >= _PARALLEL_MIN_BYTES:
+                    try:
+                        _download_ranges(client, str(head.url), dest, size)
+                        return
+                    except _RangeNotSupportedError:
+                        log.debug("range_not_supported", url=url)
+
+        with client.stream("GET", url) as r:
+            r.raise_for_status()
+            # An encoded body's Content-Length is not the size on disk
+            encoded = "content-encoding" in r.headers
+            size = 0 if encoded else int(r.headers.get("content-length", 0))
+            fd = _open_preallocated(dest, size)
+            try:
+                for chunk in _iter_body(r):
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[os.write(fd, view) :]
+            finally:
+                os.close(fd)
+
+
+def _iter_body(r: httpx.Response) -> Iterator[bytes]:
+    """Iterate a response body in large chunks.
+
+    Bodies without a Content-Encoding are read raw, skipping httpx's decoder.
+    """
+    if "content-encoding" in r.headers:
+        return r.iter_bytes(_CHUNK_BYTES)
+    return r.iter_raw(_CHUNK_BYTES)
+
+
+def _open_preallocated(dest: Path, size: int) -> int:
+    """Open dest for unbuffered writes, reserving size bytes up front if known."""
+    fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    if size > 0:
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except (AttributeError, OSError):
+            # Not available on this platform or filesystem; writes still work
+            pass
+    return fd
+
+
+def _download_ranges(client: httpx.Client, url: str, dest: Path, size: int) -> None:
+    """Fetch a file as parallel byte ranges written in place with pwrite."""
+    part = -(-size // _PARALLEL_CONNECTIONS)
+    ranges = [(start, min(start + part, size) - 1) for start in range(0, size, part)]
+    fd = _open_preallocated(dest, size)
+    try:
+
+        def fetch_range(byte_range: tuple[int, int]) -> None:
+            start, end = byte_range
+            headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+            with client.stream("GET", url, headers=headers) as r:
+                if r.status_code != 206:
+                    r.raise_for_status()
+                    raise _RangeNotSupportedError
+                offset = start
+                for chunk in _iter_body(r):
+                    view = memoryview(chunk)
+                    while view:
+                        written = os.pwrite(fd, view, offset)
+                        view = view[written:]
+                        offset += written
+            if offset != end + 1:
+                raise httpx.RemoteProtocolError(
+                    f"Incomplete range {start}-{end}: got {offset - start} bytes"
+                )
+
+        log.debug("downloading_ranges", url=url, parts=len(ranges))
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            list(pool.map(fetch_range, ranges))
+    finally:
+        os.close(fd)
+
+
 def upload_s3(local: Path | str, dest: str | S3Ref) -> S3Ref:
     """Upload a file to S3.
 
@@ -343,7 +448,7 @@ def upload_s3(local: Path | str, dest: str | S3Ref) -> S3Ref:
     """
     ref = dest if isinstance(dest, S3Ref) else S3Ref.from_uri(dest)
     log.info("uploading", dest=ref.uri)
-    _s3_client().upload_file(str(local), ref.bucket, ref.key)
+    _s3_client().upload_file(str(local), ref.bucket, ref.key, Config=_S3_TRANSFER)
     log.info("uploaded", dest=ref.uri)
     return ref
 
@@ -99,6 +99,12 @@ class TestModelSpecCapacityMetadata:
         with pytest.raises(ValueError, match="ideal_batch_size"):
             _register(max_batch_size=4, ideal_batch_size=0)
 
+    def test_reregistration_reuses_per_type_work(self) -> None:
+        first = _register()._registry.get("spec")
+        second = _register()._registry.get("spec")
+        assert first is not None and second is not None
+        assert first.inputs_adapter is second.inputs_adapter
+
 
 def _bare_context() -> RouteContext:
     return RouteContext(
@@ -0,0 +1,100 @@
+import gzip
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from thalamus_serve.storage import fetch
+
+PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
+
+
+class _Handler(BaseHTTPRequestHandler):
+    advertise_ranges = True
+    honor_ranges = True
+    gzip = False
+    range_requests: list[str]
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _send_headers(self, status: int, length: int) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        if self.advertise_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_HEAD(self) -> None:
+        self._send_headers(200, len(PAYLOAD))
+
+    def do_GET(self) -> None:
+        header = self.headers.get("Range")
+        if header and self.honor_ranges:
+            self.range_requests.append(header)
+            start, end = (int(x) for x in header.removeprefix("bytes=").split("-"))
+            self._send_headers(206, end - start + 1)
+            self.wfile.write(PAYLOAD[start : end + 1])
+        elif self.gzip:
+            body = gzip.compress(PAYLOAD)
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Content-Encoding", "gzip")
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self._send_headers(200, len(PAYLOAD))
+            self.wfile.write(PAYLOAD)
+
+
+@pytest.fixture
+def handler(monkeypatch: pytest.MonkeyPatch) -> type[_Handler]:
+    monkeypatch.setattr(fetch, "_PARALLEL_MIN_BYTES", 1024)
+    return type("Handler", (_Handler,), {"range_requests": []})
+
+
+@pytest.fixture
+def url(handler: type[_Handler]) -> Generator[str, None, None]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/model.bin"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHTTPDownload:
+    def test_parallel_ranges(
+        self, handler: type[_Handler], url: str, tmp_path: Path
+    ) -> None:
+        dest = tmp_path / "model.bin"
+        fetch._download_http(url, dest, timeout=10)
+        assert dest.read_bytes() == PAYLOAD
+        assert len(handler.range_requests) == fetch._PARALLEL_CONNECTIONS
+
+    def test_single_stream_without_range_support(
+        self, handler: type[_Handler], url: str, tmp_path: Path
+    ) -> None:
+        handler.advertise_ranges = False
+        dest = tmp_path / "model.bin"
+        fetch._download_http(url, dest, timeout=10)
+        assert dest.read_bytes() == PAYLOAD
+        assert handler.range_requests == []
+
+    def test_falls_back_when_ranges_are_ignored(
+        self, handler: type[_Handler], url: str, tmp_path: Path
+    ) -> None:
+        handler.honor_ranges = False
+        dest = tmp_path / "model.bin"
+        fetch._download_http(url, dest, timeout=10)
+        assert dest.read_bytes() == PAYLOAD
+
+    def test_encoded_body_is_decoded(
+        self, handler: type[_Handler], url: str, tmp_path: Path
+    ) -> None:
+        handler.advertise_ranges = False
+        handler.gzip = True
+        dest = tmp_path / "model.bin"
+        fetch._download_http(url, dest, timeout=10)
+        assert dest.read_bytes() == PAYLOAD
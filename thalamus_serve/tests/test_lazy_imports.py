@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import pytest
+
+import thalamus_serve
+
+
+class TestLazyExports:
+    def test_import_does_not_load_submodules(self) -> None:
+        code = (
+            "import sys, thalamus_serve; "
+            "print(any(m.startswith('thalamus_serve.') for m in sys.modules)); "
+            "print('fastapi' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.split() == ["False", "False"]
+
+    @pytest.mark.parametrize("name", thalamus_serve.__all__)
+    def test_every_public_name_resolves(self, name: str) -> None:
+        assert getattr(thalamus_serve, name) is not None
+
+    def test_aliased_names_resolve_to_their_targets(self) -> None:
+        from thalamus_serve.infra import gpu
+
+        assert thalamus_serve.clear_gpu_cache is gpu.clear_cache
+        assert thalamus_serve.get_gpu_status is gpu.get_status
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        with pytest.raises(AttributeError, match="no_such_name"):
+            thalamus_serve.no_such_name  # noqa: B018
+
+    def test_dir_lists_public_names(self) -> None:
+        assert set(thalamus_serve.__all__) <= set(dir(thalamus_serve))
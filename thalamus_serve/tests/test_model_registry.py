@@ -0,0 +1,112 @@
+import threading
+
+from pydantic import BaseModel
+
+from thalamus_serve.core.model import ModelRegistry, ModelSpec
+
+
+class RegInput(BaseModel):
+    data: str
+
+
+class RegOutput(BaseModel):
+    result: str
+
+
+def _spec(model_id: str, version: str, is_default_version: bool = False) -> ModelSpec:
+    return ModelSpec(
+        model_id=model_id,
+        version=version,
+        description="",
+        cls=object,
+        input_type=RegInput,
+        output_type=RegOutput,
+        is_default_version=is_default_version,
+    )
+
+
+class TestModelRegistryVersions:
+    def test_versions_newest_first(self) -> None:
+        registry = ModelRegistry()
+        for version in ("1.2.0", "1.10.0", "0.9.0", "1.2.0rc1"):
+            registry.register(_spec("m", version))
+        assert registry.get_versions("m") == ["1.10.0", "1.2.0", "1.2.0rc1", "0.9.0"]
+        assert registry.get_versions("missing") == []
+
+    def test_latest_resolves_to_highest_version(self) -> None:
+        registry = ModelRegistry()
+        registry.register(_spec("m", "2.0.0"))
+        registry.register(_spec("m", "10.0.0"))
+        spec = registry.get("m")
+        assert spec is not None and spec.version == "10.0.0"
+        assert registry.get("m", "latest") is spec
+
+    def test_default_version_wins_over_latest(self) -> None:
+        registry = ModelRegistry()
+        registry.register(_spec("m", "1.0.0", is_default_version=True))
+        registry.register(_spec("m", "2.0.0"))
+        spec = registry.get("m")
+        assert spec is not None and spec.version == "1.0.0"
+
+    def test_reregistering_a_version_replaces_it(self) -> None:
+        registry = ModelRegistry()
+        registry.register(_spec("m", "1.0.0"))
+        replacement = _spec("m", "1.0.0")
+        registry.register(replacement)
+        assert registry.get_versions("m") == ["1.0.0"]
+        assert registry.get("m", "1.0.0") is replacement
+
+    def test_resolution_follows_later_registrations(self) -> None:
+        registry = ModelRegistry()
+        registry.register(_spec("m", "1.0.0"))
+        newer = _spec("m", "2.0.0")
+        registry.register(newer)
+        assert registry.get("m") is newer
+        replacement = _spec("m", "2.0.0")
+        registry.register(replacement)
+        assert registry.get("m") is replacement
+        assert registry.get("missing") is None
+
+    def test_returned_list_is_a_copy(self) -> None:
+        registry = ModelRegistry()
+        registry.register(_spec("m", "1.0.0"))
+        registry.get_versions("m").clear()
+        assert registry.get_versions("m") == ["1.0.0"]
+
+
+class TestModelRegistrySnapshots:
+    def test_register_does_not_mutate_published_state(self) -> None:
+        registry = ModelRegistry()
+        registry.register(_spec("m", "1.0.0"))
+        before = registry.all_for_model("m")
+        versions = registry.get_versions("m")
+        registry.register(_spec("m", "2.0.0"))
+        assert [s.version for s in before] == ["1.0.0"]
+        assert versions == ["1.0.0"]
+        assert registry.get_versions("m") == ["2.0.0", "1.0.0"]
+
+    def test_concurrent_readers_see_consistent_state(self) -> None:
+        registry = ModelRegistry()
+        errors: list[str] = []
+        done = threading.Event()
+
+        def read() -> None:
+            while not done.is_set():
+                versions = registry.get_versions("m")
+                specs = registry.all_for_model("m")
+                latest = registry.get("m")
+                if versions and latest is None:
+                    errors.append("latest missing")
+                if len(specs) < len(versions):
+                    errors.append("versions ahead of specs")
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for t in readers:
+            t.start()
+        for minor in range(200):
+            registry.register(_spec("m", f"1.{minor}.0"))
+        done.set()
+        for t in readers:
+            t.join()
+        assert errors == []
+        assert len(registry.get_versions("m")) == 200
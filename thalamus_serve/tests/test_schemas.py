@@ -0,0 +1,86 @@
+import base64
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from thalamus_serve.schemas import common
+from thalamus_serve.schemas.common import Base64Data
+
+
+class ImageInput(BaseModel):
+    image: Base64Data
+
+
+class TestBase64Data:
+    def test_decode_returns_payload(self) -> None:
+        data = Base64Data(data=base64.b64encode(b"\x89PNG").decode())
+        assert data.decode() == b"\x89PNG"
+
+    def test_payload_is_decoded_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[str] = []
+        real = base64.b64decode
+
+        def counting(s: str, validate: bool = False) -> bytes:
+            calls.append(s)
+            return real(s, validate=validate)
+
+        monkeypatch.setattr(common._base64, "b64decode", counting)
+        data = Base64Data(data="aGVsbG8=")
+        assert data.decode() == b"hello"
+        assert data.decode() == b"hello"
+        assert len(calls) == 1
+
+    def test_invalid_base64_rejected(self) -> None:
+        with pytest.raises(ValidationError, match="Invalid base64"):
+            ImageInput.model_validate({"image": {"data": "abc"}})
+
+    def test_decoded_bytes_not_serialized(self) -> None:
+        data = Base64Data(data="aGk=", media_type="text/plain")
+        assert data.model_dump() == {"data": "aGk=", "media_type": "text/plain"}
+
+    def test_constructed_instance_decodes_lazily(self) -> None:
+        assert Base64Data.model_construct(data="aGk=").decode() == b"hi"
+
+    def test_model_copy_with_new_data_decodes_it(self) -> None:
+        original = Base64Data(data=base64.b64encode(b"one").decode())
+        assert original.decode() == b"one"
+        copy = original.model_copy(update={"data": base64.b64encode(b"two").decode()})
+        assert copy.decode() == b"two"
+        assert original.decode() == b"one"
+
+    def test_reassigned_data_is_decoded(self) -> None:
+        data = Base64Data(data=base64.b64encode(b"one").decode())
+        assert data.decode() == b"one"
+        data.data = base64.b64encode(b"two").decode()
+        assert data.decode() == b"two"
+
+    @pytest.mark.parametrize(
+        "encoded",
+        [
+            "aGVs\nbG8=",
+            "aGVs bG8=",
+            "aGVsbG8",
+            # Padding mid-string and stray characters: pybase64's lenient
+            # mode rejects or decodes these differently from the stdlib
+            "aGVsbG8=aGk=",
+            "aGk=aGk",
+            "AB+==0",
+            "aGVs*bG8=",
+        ],
+    )
+    def test_lenient_decoding_matches_stdlib(self, encoded: str) -> None:
+        # Whichever decoder is active must accept what base64.b64decode does
+        try:
+            expected = base64.b64decode(encoded)
+        except ValueError:
+            with pytest.raises(ValidationError, match="Invalid base64"):
+                Base64Data(data=encoded)
+            return
+        assert Base64Data(data=encoded).decode() == expected
+
+    def test_pybase64_decoder_used_when_installed(self) -> None:
+        pybase64 = pytest.importorskip("pybase64")
+        assert common._base64 is pybase64
+        assert Base64Data(data="aGVs\nbG8=").decode() == b"hello"
+        with pytest.raises(ValidationError, match="Invalid base64"):
+            ImageInput.model_validate({"image": {"data": "abc"}})
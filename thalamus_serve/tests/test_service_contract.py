@@ -319,6 +319,15 @@ class TestPredictContract:
         )
         assert r.status_code == 422
 
+    def test_invalid_input_reports_its_index(self, client: TestClient) -> None:
+        r = client.post(
+            "/predict",
+            json={"model": "default", "inputs": [{"data": "ok"}, {"data": 1}]},
+            headers=TEST_API_KEY_HEADER,
+        )
+        assert r.status_code == 422
+        assert r.json()["error"][0]["loc"] == [1, "data"]
+
 
 class TestdefaultModel:
     def test_predict_without_model_uses_default(self, client: TestClient) -> None:
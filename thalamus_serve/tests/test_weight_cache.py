@@ -0,0 +1,407 @@
+import hashlib
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import FrozenInstanceError, replace
+from pathlib import Path
+
+import pytest
+
+from thalamus_serve.infra.cache import CachePolicy, CacheStats, WeightCache
+
+
+def _writer(size: int, calls: list[Path] | None = None) -> Callable[[Path], None]:
+    def download(dest: Path) -> None:
+        if calls is not None:
+            calls.append(dest)
+        dest.write_bytes(b"x" * size)
+
+    return download
+
+
+class TestWeightCacheIndex:
+    def test_put_downloads_once(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        calls: list[Path] = []
+        first = cache.put("s3://bucket/model.pt", _writer(10, calls))
+        second = cache.put("s3://bucket/model.pt", _writer(10, calls))
+        assert first == second
+        assert first.read_bytes() == b"x" * 10
+        assert len(calls) == 1
+
+    def test_get_and_contains(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        assert cache.get("k") is None
+        assert not cache.contains("k")
+        path = cache.put("k", _writer(3))
+        assert cache.get("k") == path
+        assert cache.contains("k")
+        stats = cache.stats()
+        assert (stats.hit_count, stats.miss_count) == (1, 2)
+
+    def test_hits_do_not_touch_the_filesystem(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = WeightCache(tmp_path)
+        path = cache.put("k", _writer(3))
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("filesystem access on a cache hit")
+
+        monkeypatch.setattr(Path, "stat", fail)
+        monkeypatch.setattr(Path, "exists", fail)
+        monkeypatch.setattr(Path, "is_file", fail)
+        assert cache.get("k") == path
+        assert cache.contains("k")
+
+    def test_index_rebuilt_from_disk(self, tmp_path: Path) -> None:
+        path = WeightCache(tmp_path).put("k", _writer(5))
+        cache = WeightCache(tmp_path)
+        stats = cache.stats()
+        assert stats.file_count == 1
+        assert stats.total_size_bytes == 5
+        assert cache.get("k") == path
+
+    def test_adopts_files_written_by_another_process(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        path = WeightCache(tmp_path).put("k", _writer(5))
+        assert cache.get("k") == path
+        assert cache.stats().total_size_bytes == 5
+
+    def test_entry_names_are_stable(self, tmp_path: Path) -> None:
+        # Existing caches are keyed by this layout; changing it orphans them
+        digest = hashlib.sha256(b"s3://bucket/model.pt").hexdigest()[:16]
+        path = WeightCache(tmp_path).put("s3://bucket/model.pt", _writer(1))
+        assert path == tmp_path / f"{digest}_model.pt"
+
+    def test_clear_resets_index(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        cache.put("a", _writer(4))
+        cache.put("b", _writer(6))
+        assert cache.clear() == (10, 2)
+        assert cache.get("a") is None
+        assert cache.stats().total_size_bytes == 0
+
+
+class TestWeightCacheEviction:
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        # 1000 byte limit, eviction brings the cache down to 800 bytes
+        cache = WeightCache(tmp_path, max_size_gb=1e-6)
+        cache.put("a", _writer(400))
+        cache.put("b", _writer(400))
+        cache.get("a")
+        cache.put("c", _writer(400))
+        cache.put("d", _writer(400))
+        assert cache.contains("a")
+        assert not cache.contains("b")
+        assert cache.contains("c")
+        assert cache.contains("d")
+        assert cache.stats().total_size_bytes == 1200
+
+    def test_recency_ignores_file_access_times(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path, max_size_gb=1e-6)
+        a = cache.put("a", _writer(400))
+        cache.put("b", _writer(400))
+        cache.get("a")
+        # As on a noatime mount: "a" looks like the oldest file on disk
+        os.utime(a, (0, 0))
+        cache.put("c", _writer(400))
+        cache.put("d", _writer(400))
+        assert cache.contains("a")
+        assert not cache.contains("b")
+
+    def test_initial_order_follows_access_times(self, tmp_path: Path) -> None:
+        seed = WeightCache(tmp_path)
+        a = seed.put("a", _writer(400))
+        b = seed.put("b", _writer(400))
+        os.utime(a, (200, 200))
+        os.utime(b, (100, 100))
+        cache = WeightCache(tmp_path, max_size_gb=1e-6)
+        cache.put("c", _writer(400))
+        cache.put("d", _writer(400))
+        assert cache.contains("a")
+        assert not cache.contains("b")
+
+
+class TestWeightCacheLocking:
+    def test_reads_do_not_wait_for_the_lock(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        cache.put("k", _writer(3))
+        results: list[object] = []
+
+        def read() -> None:
+            results.append(cache.contains("k"))
+            results.append(cache.stats().file_count)
+
+        with cache._lock:
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(timeout=5)
+            assert not reader.is_alive()
+        assert results == [True, 1]
+
+    def test_concurrent_hits_are_all_counted(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        cache.put("k", _writer(3))
+
+        def hit() -> None:
+            for _ in range(500):
+                cache.get("k")
+
+        threads = [threading.Thread(target=hit) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert cache.stats().hit_count == 8 * 500
+
+    def test_download_runs_outside_the_lock(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        cache.put("cached", _writer(3))
+        started, release = threading.Event(), threading.Event()
+
+        def slow(dest: Path) -> None:
+            started.set()
+            release.wait(timeout=5)
+            dest.write_bytes(b"slow")
+
+        downloader = threading.Thread(target=cache.put, args=("slow", slow))
+        downloader.start()
+        assert started.wait(timeout=5)
+        # Other keys are served and downloaded while "slow" is in flight
+        assert cache.get("cached") is not None
+        assert cache.put("other", _writer(2)).read_bytes() == b"xx"
+        release.set()
+        downloader.join(timeout=5)
+        assert cache.get("slow") is not None
+
+    def test_concurrent_puts_share_one_download(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        calls: list[Path] = []
+        release = threading.Event()
+
+        def slow(dest: Path) -> None:
+            calls.append(dest)
+            release.wait(timeout=5)
+            dest.write_bytes(b"data")
+
+        results: list[Path] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.put("k", slow)))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+        assert len(calls) == 1
+        assert len(results) == 4
+        assert len(set(results)) == 1
+        assert cache.stats().miss_count == 1
+
+    def test_failed_download_reaches_waiters_and_can_retry(
+        self, tmp_path: Path
+    ) -> None:
+        cache = WeightCache(tmp_path)
+        started, release = threading.Event(), threading.Event()
+
+        def failing(dest: Path) -> None:
+            dest.write_bytes(b"partial")
+            started.set()
+            release.wait(timeout=5)
+            raise RuntimeError("network down")
+
+        errors: list[BaseException] = []
+
+        def put() -> None:
+            try:
+                cache.put("k", failing)
+            except RuntimeError as e:
+                errors.append(e)
+
+        owner = threading.Thread(target=put)
+        owner.start()
+        assert started.wait(timeout=5)
+        waiter = threading.Thread(target=put)
+        waiter.start()
+        release.set()
+        owner.join(timeout=5)
+        waiter.join(timeout=5)
+        assert len(errors) == 2
+        assert list(tmp_path.iterdir()) == []
+        assert cache.put("k", _writer(1)).read_bytes() == b"x"
+
+
+def _dir_writer(*sizes: int) -> Callable[[Path], None]:
+    def download(dest: Path) -> None:
+        for i, size in enumerate(sizes):
+            (dest / f"shard-{i}.bin").write_bytes(b"x" * size)
+
+    return download
+
+
+def _hf_repo(cache_dir: Path, name: str, size: int) -> Path:
+    """Lay out a repo the way huggingface_hub does: snapshots link to blobs."""
+    repo = cache_dir / "huggingface" / f"models--org--{name}"
+    (repo / "blobs").mkdir(parents=True)
+    (repo / "snapshots" / "abc").mkdir(parents=True)
+    (repo / "blobs" / "sha").write_bytes(b"x" * size)
+    (repo / "snapshots" / "abc" / "model.bin").symlink_to(repo / "blobs" / "sha")
+    return repo
+
+
+class TestWeightCacheDirectories:
+    def test_put_dir_marks_directory_complete(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        path = cache.put_dir("s3_prefixes", "s3://bucket/model/", _dir_writer(3, 4))
+        assert (path / ".complete").exists()
+        assert cache.get_dir("s3_prefixes", "s3://bucket/model/") == path
+        stats = cache.stats()
+        assert stats.file_count == 2
+        assert stats.total_size_bytes == 7
+
+    def test_failed_dir_download_is_removed(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+
+        def failing(dest: Path) -> None:
+            (dest / "partial.bin").write_bytes(b"x")
+            raise RuntimeError("network down")
+
+        with pytest.raises(RuntimeError):
+            cache.put_dir("http_urls", "k", failing)
+        assert list((tmp_path / "http_urls").iterdir()) == []
+        assert cache.get_dir("http_urls", "k") is None
+
+    def test_index_rebuilt_from_complete_directories(self, tmp_path: Path) -> None:
+        path = WeightCache(tmp_path).put_dir("http_urls", "k", _dir_writer(5))
+        (tmp_path / "http_urls" / "unfinished").mkdir()
+        (tmp_path / "http_urls" / "unfinished" / "shard.bin").write_bytes(b"x")
+        cache = WeightCache(tmp_path)
+        stats = cache.stats()
+        assert stats.file_count == 1
+        assert stats.total_size_bytes == 5
+        assert cache.get_dir("http_urls", "k") == path
+
+    def test_files_and_directories_share_one_lru(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path, max_size_gb=1e-6)
+        shards = cache.put_dir("s3_prefixes", "shards", _dir_writer(200, 200))
+        cache.put("a", _writer(400))
+        cache.get_dir("s3_prefixes", "shards")
+        cache.put("b", _writer(400))
+        cache.put("c", _writer(400))
+        assert shards.exists()
+        assert not cache.contains("a")
+        assert cache.contains("b")
+        assert cache.stats().total_size_bytes == 1200
+
+    def test_artifacts_indexed_on_startup_and_cleared(self, tmp_path: Path) -> None:
+        path = WeightCache(tmp_path).put_dir("artifacts", "int8", _dir_writer(6))
+        cache = WeightCache(tmp_path)
+        assert cache.get_dir("artifacts", "int8") == path
+        assert cache.stats().total_size_bytes == 6
+        assert cache.clear() == (6, 1)
+        assert not path.exists()
+
+    def test_unknown_namespace_rejected(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        with pytest.raises(ValueError, match="Unknown cache namespace"):
+            cache.put_dir("engines", "k", _dir_writer(1))
+        assert list(tmp_path.iterdir()) == []
+
+    def test_clear_counts_hf_blobs_once(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        cache.put_dir("s3_prefixes", "k", _dir_writer(3, 4))
+        cache.track_dir(_hf_repo(tmp_path, "model", 10))
+        assert cache.stats().total_size_bytes == 17
+        assert cache.clear() == (17, 3)
+        assert list(tmp_path.iterdir()) == [tmp_path / "s3_prefixes"]
+
+    def test_hf_repos_indexed_on_startup(self, tmp_path: Path) -> None:
+        _hf_repo(tmp_path, "model", 10)
+        stats = WeightCache(tmp_path).stats()
+        assert (stats.total_size_bytes, stats.file_count) == (10, 1)
+
+    def test_tracked_hf_repos_share_the_lru(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path, max_size_gb=1e-6)
+        old = cache.track_dir(_hf_repo(tmp_path, "old", 600))
+        cache.put("a", _writer(400))
+        cache.track_dir(_hf_repo(tmp_path, "new", 400))
+        cache.put("b", _writer(100))
+        assert not old.exists()
+        assert cache.contains("a")
+        assert cache.stats().total_size_bytes == 900
+
+    def test_tracking_again_refreshes_size(self, tmp_path: Path) -> None:
+        cache = WeightCache(tmp_path)
+        repo = cache.track_dir(_hf_repo(tmp_path, "model", 10))
+        (repo / "blobs" / "other").write_bytes(b"x" * 5)
+        cache.track_dir(repo)
+        stats = cache.stats()
+        assert (stats.total_size_bytes, stats.file_count) == (15, 2)
+
+
+class TestWeightCachePolicy:
+    @pytest.mark.parametrize(("policy", "hot_kept"), [("lru", False), ("slru", True)])
+    def test_one_off_downloads_and_a_reused_entry(
+        self, tmp_path: Path, policy: CachePolicy, hot_kept: bool
+    ) -> None:
+        cache = WeightCache(tmp_path, max_size_gb=1e-6, policy=policy)
+        cache.put("hot", _writer(400))
+        cache.get("hot")
+        cache.put("x", _writer(400))
+        cache.put("y", _writer(400))
+        cache.put("z", _writer(400))
+        assert cache.contains("hot") is hot_kept
+        assert cache.contains("x") is not hot_kept
+
+    def test_slru_demotes_protected_overflow(self, tmp_path: Path) -> None:
+        # Protected segment holds 800 of the 1000 bytes
+        cache = WeightCache(tmp_path, max_size_gb=1e-6, policy="slru")
+        for key in ("a", "b", "c"):
+            cache.put(key, _writer(300))
+            cache.get(key)
+        # "a" was demoted when "c" was promoted, so it goes before newer "d"
+        cache.put("d", _writer(200))
+        cache.put("e", _writer(10))
+        assert not cache.contains("a")
+        assert all(cache.contains(key) for key in ("b", "c", "d", "e"))
+
+    def test_unknown_policy_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Unknown cache policy"):
+            WeightCache(tmp_path, policy="fifo")  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize(
+        ("policy", "small_kept"), [("lru", False), ("lru-sp", True)]
+    )
+    def test_large_cold_entry_and_small_hot_entry(
+        self, tmp_path: Path, policy: CachePolicy, small_kept: bool
+    ) -> None:
+        cache = WeightCache(tmp_path, max_size_gb=1e-6, policy=policy)
+        cache.put("config", _writer(50))
+        for _ in range(3):
+            cache.get("config")
+        cache.put("big", _writer(500))
+        cache.put("x", _writer(300))
+        cache.put("y", _writer(200))
+        cache.put("z", _writer(10))
+        assert not cache.contains("big")
+        assert cache.contains("config") is small_kept
+
+
+class TestCacheStats:
+    def test_hit_rate(self) -> None:
+        stats = CacheStats(
+            total_size_bytes=0,
+            file_count=0,
+            max_size_bytes=1,
+            hit_count=3,
+            miss_count=1,
+        )
+        assert stats.hit_rate == 0.75
+        assert replace(stats, hit_count=0, miss_count=0).hit_rate == 0.0
+
+    def test_is_immutable(self) -> None:
+        stats = CacheStats(0, 0, 1, 0, 0)
+        with pytest.raises(FrozenInstanceError):
+            stats.file_count = 1  # type: ignore[misc]
@@ -0,0 +1,46 @@
+import threading
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from thalamus_serve.config import HFWeight, HTTPWeight, S3Weight
+from thalamus_serve.storage import fetch
+
+
+class TestWeightSourceType:
+    def test_type_tags(self) -> None:
+        assert S3Weight(bucket="b", key="k").type == "s3"
+        assert HFWeight(repo="org/model").type == "hf"
+        assert HTTPWeight(urls=("https://example.com/m.pt",)).type == "http"
+
+    def test_mismatched_type_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            S3Weight(bucket="b", key="k", type="hf")  # type: ignore[call-arg]
+
+    def test_fetch_weight_dispatches_on_type(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        source = HFWeight(repo="org/model")
+        monkeypatch.setitem(fetch._WEIGHT_FETCHERS, "hf", lambda s: Path(s.repo))
+        assert fetch.fetch_weight(source) == Path("org/model")
+
+    def test_fetch_weight_rejects_unknown_source(self) -> None:
+        with pytest.raises(ValueError, match="Unknown weight source type"):
+            fetch.fetch_weight(object())  # type: ignore[arg-type]
+
+
+class TestS3Client:
+    def test_shared_across_threads(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(fetch, "_s3", None)
+        clients: list[object] = []
+        threads = [
+            threading.Thread(target=lambda: clients.append(fetch._s3_client()))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert all(c is fetch._s3_client() for c in clients)
+        assert fetch._s3_client().meta.config.max_pool_connections == 64